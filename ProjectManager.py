@@ -1,12 +1,23 @@
+import errno
 import hashlib
+import io
+import mmap
 import pickle
 import os
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, List, NamedTuple, Set, Tuple, Union
 from pathlib import Path
 import shutil
-import pandas as pd
+import struct
+import sys
+import tempfile
+import threading
+import time
+import logging
+import weakref
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager, suppress
 
 
 # TODO: Implement _update_volume() method
@@ -15,7 +26,174 @@ import pandas as pd
 # TODO: Implement check_feasibility() method --> checks if the model is 3D printable
 
 
-@dataclass
+# The index writer runs on a background thread, where print() could reach a GUI's redirected stdout
+logger = logging.getLogger(__name__)
+
+
+def _load_pickle(path: Path, buffers=None):
+    """Unpickle a file through a read-only memory map, bypassing buffered file reads."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            raise EOFError(f"{path} is empty")
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm, buffers=buffers)
+    finally:
+        os.close(fd)
+
+
+_umask: Optional[int] = None
+_umask_lock = threading.Lock()
+
+
+def _get_umask() -> int:
+    """
+    Return the process umask, so temporary files get the same permissions open() would give them.
+
+    Looked up once, on first use. Linux reports it in /proc; elsewhere the only way to
+    read it is to set it and put it back, which is done under a lock.
+    """
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            try:
+                with open("/proc/self/status") as f:
+                    _umask = next(int(line.split()[1], 8) for line in f if line.startswith("Umask:"))
+            except (OSError, StopIteration, ValueError, IndexError):
+                _umask = os.umask(0o077)
+                os.umask(_umask)
+        return _umask
+
+
+@contextmanager
+def _atomic_write(path: Path):
+    """
+    Yield an unbuffered file that replaces path atomically once the block succeeds.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(temp_name, 0o666 & ~_get_umask())
+        with io.FileIO(fd, "wb") as raw:
+            yield raw
+        os.replace(temp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+
+
+# Chunk size for the user-space copy fallback; 1 MiB beats smaller buffers and sendfile for warm-cache copies
+_COPY_BUFSIZE = 1 << 20
+
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copy a file's data and metadata, in-kernel via copy_file_range where supported."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        copied = 0
+        if hasattr(os, "copy_file_range"):
+            size = os.fstat(fsrc.fileno()).st_size
+            try:
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                # e.g. kernels without cross-filesystem support; finish with a plain copy
+                pass
+        fsrc.seek(copied)
+        fdst.seek(copied)
+        buf = bytearray(_COPY_BUFSIZE)
+        view = memoryview(buf)
+        while n := fsrc.readinto(buf):
+            fdst.write(view[:n])
+    shutil.copystat(src, dst)
+
+
+def _move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Move a file with a single rename, falling back to copy + unlink across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_file(src, dst)
+        os.unlink(src)
+
+
+# Per-category counter attributes used by Project pickles that predate Project._counts
+_LEGACY_COUNTERS = {
+    "_id_change_count": "Project ID Change",
+    "_file_change_count": "Project File Change",
+    "_status_change_count": "Status Change",
+    "_responsibility_change_count": "responsibility Change",
+    "_responsible_change_count": "responsibility Change",
+    "_quantity_change_count": "Quantity Change",
+    "_name_change_count": "Name Change",
+    "_customer_change_count": "Customer ID Change",
+    "_shipping_info_change_count": "Shipping Info Change",
+    "_comment_change_count": "Comment Change",
+}
+
+
+class ChangeLogEntry(NamedTuple):
+    """A single change-log record, formatted only when displayed."""
+    category: str
+    count: int
+    ts: int  # time.time_ns()
+    msg: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.category} #{self.count}"
+
+    @property
+    def timestamp(self) -> str:
+        """Return the entry time as an ISO 8601 string."""
+        return datetime.fromtimestamp(self.ts / 1e9).isoformat()
+
+    def __str__(self) -> str:
+        return f"{self.key}: {self.timestamp}: {self.msg}"
+
+
+# Keys of the {"Address": ..., "Post Code": ...} dict form of ShippingInfo
+_SHIPPING_KEYS = frozenset({"Address", "Post Code"})
+
+
+class ShippingInfo(NamedTuple):
+    """Shipping details of a project."""
+    address: Optional[str] = None
+    post_code: Optional[str] = None
+    # Any other fields of a legacy shipping dict, kept so converting it loses nothing
+    extra: Optional[Dict[str, Union[str, int]]] = None
+
+    @classmethod
+    def from_dict(cls, info: Dict[str, Union[str, int]]) -> "ShippingInfo":
+        """Build from the {"Address": ..., "Post Code": ...} dict form; any other set of keys is a ValueError."""
+        missing = sorted(_SHIPPING_KEYS - info.keys())
+        unknown = sorted(info.keys() - _SHIPPING_KEYS)
+        if missing or unknown:
+            raise ValueError(
+                f"Shipping info needs exactly the keys 'Address' and 'Post Code' "
+                f"(missing: {missing or 'none'}, unknown: {unknown or 'none'})"
+            )
+        return cls(info["Address"], info["Post Code"])
+
+    @classmethod
+    def from_legacy_dict(cls, info: Dict[str, Union[str, int]]) -> "ShippingInfo":
+        """Convert the free-form dict older pickles stored, keeping keys besides Address and Post Code in extra."""
+        extra = {key: value for key, value in info.items() if key not in _SHIPPING_KEYS}
+        return cls(info.get("Address"), info.get("Post Code"), extra or None)
+
+
+def _iso_to_ns(timestamp: str) -> int:
+    return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000_000)
+
+
+@dataclass(slots=True)
 class Project:
     """
     Represents a 3D printing project with comprehensive tracking of versions,
@@ -34,7 +212,7 @@ class Project:
         Optional:
         project_name (Optional[str]): Human-readable project name.
         customer_id (Optional[str]): Identifier for the customer.
-        shipping_info (Optional[Dict[str, Union[str, int]]]): Shipping details.
+        shipping_info (Optional[ShippingInfo]): Shipping details (address, post code).
         comments (Dict[str, str]): Comments with timestamps.
     """
 
@@ -51,89 +229,163 @@ class Project:
     # Optional
     project_name: Optional[str] = None
     customer_id: Optional[str] = None
-    shipping_info: Optional[Dict[str, Union[str, int]]] = None
+    shipping_info: Optional[ShippingInfo] = None
     comments: Dict[str, str] = field(default_factory=dict)
     _comment_id: int = 0
 
     # Change log
-    change_log: Dict[str, str] = field(default_factory=dict)
+    change_log: List[ChangeLogEntry] = field(default_factory=list)
 
-    # Change counters
+    # Change counters, keyed by change-log category
     _file_version: int = 1
-    _id_change_count: int = 0
-    _file_change_count: int = 0
-    _status_change_count: int = 0
-    _responsibility_change_count: int = 0
-    _quantity_change_count: int = 0
-    _name_change_count: int = 0
-    _customer_change_count: int = 0
-    _shipping_info_change_count: int = 0
-    _comment_change_count: int = 0
+    _counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    # Cached master_id_sub_id, refreshed whenever either part changes
+    _project_id_str: str = field(default="", init=False, repr=False)
+    # Whether archive_directory is known to exist; reset on unpickle
+    _archive_dir_ensured: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.shipping_info, dict):
+            self.shipping_info = ShippingInfo.from_dict(self.shipping_info)
+        self._intern_strings()
+        self._refresh_project_id()
+
+    def __getstate__(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: dict) -> None:
+        if "responsible" in state:
+            # Renamed to responsibility
+            state["responsibility"] = state.pop("responsible")
+        if "_counts" not in state:
+            # Projects pickled before _counts kept one attribute per counter
+            counts = defaultdict(int)
+            for attr, category in _LEGACY_COUNTERS.items():
+                if attr in state:
+                    counts[category] = state.pop(attr)
+            state["_counts"] = counts
+        if isinstance(state.get("change_log"), dict):
+            # Projects pickled before ChangeLogEntry stored "Category #N" -> "timestamp: message"
+            change_log = []
+            for key, value in state["change_log"].items():
+                category, _, count = key.rpartition(" #")
+                ts, _, msg = value.partition(" ")
+                change_log.append(ChangeLogEntry(category, int(count), _iso_to_ns(ts.rstrip(":")), msg))
+            state["change_log"] = change_log
+        if isinstance(state.get("shipping_info"), dict):
+            # Projects pickled before ShippingInfo stored a {"Address", "Post Code", ...} dict
+            state["shipping_info"] = ShippingInfo.from_legacy_dict(state["shipping_info"])
+        for f in fields(self):
+            if f.name in state:
+                value = state[f.name]
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                value = f.default
+            setattr(self, f.name, value)
+        self._archive_dir_ensured = False
+        self._intern_strings()
+        self._refresh_project_id()
+
+    def _intern_strings(self) -> None:
+        """Intern the short, highly repeated strings shared across many projects."""
+        self.master_id = sys.intern(self.master_id)
+        self.status = sys.intern(self.status)
+        self.responsibility = {sys.intern(k): v for k, v in self.responsibility.items()}
+
+    def _refresh_project_id(self) -> None:
+        self._project_id_str = f"{self.master_id}_{self.sub_id}"
 
     def get_project_id(self) -> str:
         """Return the unique project ID as master_id_sub_id."""
-        return f"{self.master_id}_{self.sub_id}"
+        return self._project_id_str
 
     def get_file_version(self) -> str:
         """Return the file version string."""
         return f"{self.get_project_id()}_v{self._file_version}"
 
+    @staticmethod
+    def _now_iso() -> str:
+        """Return the current time as an ISO 8601 string."""
+        return datetime.now().isoformat()
+
+    def _record(self, category: str, msg: str) -> None:
+        """Increment the category's change counter and add a timestamped change-log entry."""
+        self._counts[category] += 1
+        self.change_log.append(ChangeLogEntry(category, self._counts[category], time.time_ns(), msg))
+
     def add_comment(self, comment: str) -> None:
         """Add a timestamped comment."""
-        self._comment_change_count += 1
         self._comment_id += 1
-        timestamp = datetime.now().isoformat()
-        self.comments[f"comment_{self._comment_id}"] = f"{timestamp}: {comment}"
-        self.change_log[f"Comment Change #{self._comment_change_count}"] = (
-            f"{timestamp}: comment_{self._comment_id} added"
-        )
+        self.comments[f"comment_{self._comment_id}"] = f"{self._now_iso()}: {comment}"
+        self._record("Comment Change", f"comment_{self._comment_id} added")
 
     def remove_comment(self, comment_id: int) -> None:
         """Remove a comment by its comment_id."""
         key = f"comment_{comment_id}"
         if key not in self.comments:
             raise KeyError(f"Comment {comment_id} not found")
-        self._comment_change_count += 1
-        timestamp = datetime.now().isoformat()
         del self.comments[key]
-        self.change_log[f"Comment Change #{self._comment_change_count}"] = (
-            f"{timestamp}: Comment {comment_id} deleted"
-        )
+        self._record("Comment Change", f"Comment {comment_id} deleted")
 
     def edit_comment(self, updated_comment: str, comment_id: int) -> None:
         """Edit an existing comment."""
         key = f"comment_{comment_id}"
         if key not in self.comments:
             raise KeyError(f"Comment {comment_id} not found")
-        self._comment_change_count += 1
-        timestamp = datetime.now().isoformat()
-        self.comments[key] = f"edited {timestamp}: {updated_comment}"
-        self.change_log[f"Comment Change #{self._comment_change_count}"] = (
-            f"{timestamp}: Comment {comment_id} edited"
-        )
+        self.comments[key] = f"edited {self._now_iso()}: {updated_comment}"
+        self._record("Comment Change", f"Comment {comment_id} edited")
+
+    def update(self, **changes) -> None:
+        """
+        Apply several updates in one call, e.g. update(status="Printing", quantity=5).
+
+        Each keyword names an update_<name> method. A plain tuple value is unpacked as
+        positional arguments (e.g. responsibility=("QA", ["Bob"])), anything else,
+        including a ShippingInfo, is passed as the single argument. All names are
+        checked before any change is made.
+        """
+        methods = []
+        for name, value in changes.items():
+            method = getattr(self, f"update_{name}", None)
+            if not callable(method):
+                raise ValueError(f"Unknown update '{name}'")
+            methods.append((method, value))
+
+        for method, value in methods:
+            if type(value) is tuple:
+                method(*value)
+            else:
+                method(value)
 
     def update_master_id(self, new_master_id: str) -> None:
         """Update the master project ID."""
-        self._id_change_count += 1
-        timestamp = datetime.now().isoformat()
+        if new_master_id == self.master_id:
+            return
         old_project_id = self.get_project_id()
-        self.master_id = new_master_id
-        new_project_id = self.get_project_id()
-        self.change_log[f"Project ID Change #{self._id_change_count}"] = (
-            f"{timestamp}: Project moved under master project {new_master_id}. "
-            f"Project ID changed from {old_project_id} to {new_project_id}"
+        self.master_id = sys.intern(new_master_id)
+        self._refresh_project_id()
+        self._record(
+            "Project ID Change",
+            f"Project moved under master project {new_master_id}. "
+            f"Project ID changed from {old_project_id} to {self.get_project_id()}"
         )
 
     def update_sub_id(self, new_sub_id: int) -> None:
-        """Update the master project ID."""
-        self._id_change_count += 1
-        timestamp = datetime.now().isoformat()
+        """Update the sub project ID."""
+        if new_sub_id == self.sub_id:
+            return
         old_project_id = self.get_project_id()
         self.sub_id = new_sub_id
-        new_project_id = self.get_project_id()
-        self.change_log[f"Project ID Change #{self._id_change_count}"] = (
-            f"{timestamp}: Project ID changed from {old_project_id} to {new_project_id}. "
-        )
+        self._refresh_project_id()
+        self._record("Project ID Change", f"Project ID changed from {old_project_id} to {self.get_project_id()}")
+
+    def _ensure_archive_dir(self) -> None:
+        """Create the archive directory once instead of on every versioned update."""
+        if not self._archive_dir_ensured:
+            self.archive_directory.mkdir(parents=True, exist_ok=True)
+            self._archive_dir_ensured = True
 
     def update_file(self, new_file: str, new_version: bool = False) -> None:
         """Update the file path, optionally versioning it."""
@@ -142,82 +394,93 @@ class Project:
             raise FileNotFoundError(f"File {new_file} does not exist")
         if new_file == self.file:
             raise ValueError("New file cannot be the same as current file")
-        self._file_change_count += 1
-        timestamp = datetime.now().isoformat()
 
         if new_version:
             archived_filename = f"{self.get_file_version()}{self.file.suffix}"
             archived_path = self.archive_directory / archived_filename
-            self.archive_directory.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(self.file), str(archived_path))
+            self._ensure_archive_dir()
+            _move_file(self.file, archived_path)
             self._file_version += 1
             self.file = new_file
             self._update_volume()
-            self.change_log[f"Project File Change #{self._file_change_count}"] = (
-                f"{timestamp}: File version updated to {self.get_file_version()}, new volume {self.volume}"
+            self._record(
+                "Project File Change",
+                f"File version updated to {self.get_file_version()}, new volume {self.volume}"
             )
         else:
             self.file = new_file
             self._update_volume()
-            self.change_log[f"Project File Change #{self._file_change_count}"] = (
-                f"{timestamp}: File updated (same version), new volume {self.volume}"
-            )
+            self._record("Project File Change", f"File updated (same version), new volume {self.volume}")
+
+    def update_files(self, updates: List[Tuple[str, bool]]) -> None:
+        """
+        Apply several (new_file, new_version) file updates in order.
+
+        Each step archives the file set by the previous one, so the moves stay
+        sequential. Every entry is checked before anything is archived: a missing
+        file, one equal to the file before it, or one an earlier step archives
+        leaves the project untouched. An OSError from a move part way through
+        still leaves the earlier steps applied.
+        """
+        missing = [str(new_file) for new_file, _ in updates if not os.path.exists(new_file)]
+        if missing:
+            raise FileNotFoundError(f"Files do not exist: {', '.join(missing)}")
+        current, archived = self.file, set()
+        for new_file, new_version in updates:
+            new_file = Path(new_file)
+            if new_file == current:
+                raise ValueError(f"New file {new_file} cannot be the same as the file before it")
+            if new_file in archived:
+                raise ValueError(f"File {new_file} is archived by an earlier update")
+            if new_version:
+                archived.add(current)
+            current = new_file
+        if any(new_version for _, new_version in updates):
+            self._ensure_archive_dir()
+        for new_file, new_version in updates:
+            self.update_file(new_file, new_version=new_version)
 
     def update_file_directories(self, new_file_path: Optional[str] = None, new_archive_path: Optional[str] = None) -> None:
         """Update the directories for active files and archive."""
         if new_file_path is None and new_archive_path is None:
             raise ValueError("Must provide at least one new path")
-        timestamp = datetime.now().isoformat()
 
         if new_file_path is not None:
             new_file_path = Path(new_file_path)
-            self._file_change_count += 1
             new_file_path.mkdir(parents=True, exist_ok=True)
             target_file = new_file_path / self.file.name
-            shutil.move(str(self.file), str(target_file))
+            _move_file(self.file, target_file)
             self.file = target_file
-            self.change_log[f"Project File Change #{self._file_change_count}"] = (
-                f"{timestamp}: File directory changed to {new_file_path}"
-            )
+            self._record("Project File Change", f"File directory changed to {new_file_path}")
         if new_archive_path is not None:
             new_archive_path = Path(new_archive_path)
-            self._file_change_count += 1
             new_archive_path.mkdir(parents=True, exist_ok=True)
-            for archived_file in self.archive_directory.iterdir():
-                if archived_file.is_file()and archived_file.suffix.lower() in {".stl", ".obj"}:
-                    target_file = new_archive_path / archived_file.name
-                    shutil.move(str(archived_file), str(target_file))
+            with os.scandir(self.archive_directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and os.path.splitext(entry.name)[1].lower() in {".stl", ".obj"}:
+                        _move_file(entry.path, new_archive_path / entry.name)
             self.archive_directory = new_archive_path
-            self.change_log[f"Project File Change #{self._file_change_count}"] = (
-                f"{timestamp}: Archive directory changed to {new_archive_path}"
-            )
+            self._archive_dir_ensured = True
+            self._record("Project File Change", f"Archive directory changed to {new_archive_path}")
 
     def update_status(self, new_status: str) -> None:
         """Update the status of the project."""
-        self._status_change_count += 1
-        timestamp = datetime.now().isoformat()
-        self.status = new_status
-        self.change_log[f"Status Change #{self._status_change_count}"] = (
-            f"{timestamp} Status changed to {new_status}"
-        )
+        if new_status == self.status:
+            return
+        self.status = sys.intern(new_status)
+        self._record("Status Change", f"Status changed to {new_status}")
 
     def update_responsibility(self, responsibility_type: str, responsible: List[str]) -> None:
         """Update the responsible for a specific responsibility type."""
-        self._responsibility_change_count += 1
-        timestamp = datetime.now().isoformat()
-        self.responsibility[responsibility_type] = responsible
-        self.change_log[f"responsibility Change #{self._responsibility_change_count}"] = (
-            f"{timestamp}: {responsibility_type} updated to {responsible}"
-        )
+        if self.responsibility.get(responsibility_type) == responsible:
+            return
+        self.responsibility[sys.intern(responsibility_type)] = responsible
+        self._record("responsibility Change", f"{responsibility_type} updated to {responsible}")
 
     def delete_responsibility(self, responsibility_type: str) -> None:
         """Delete the responsibility persons for a specific responsibility type."""
-        self._responsibility_change_count += 1
-        timestamp = datetime.now().isoformat()
         self.responsibility.pop(responsibility_type, None)
-        self.change_log[f"responsibility Change #{self._responsibility_change_count}"] = (
-            f"{timestamp}: responsibility type {responsibility_type} deleted."
-        )
+        self._record("responsibility Change", f"responsibility type {responsibility_type} deleted.")
 
     def _update_volume(self) -> None:
         """Update the volume from the 3D file (currently placeholder)."""
@@ -226,40 +489,34 @@ class Project:
 
     def update_quantity(self, new_quantity: int) -> None:
         """Update the quantity to produce."""
-        self._quantity_change_count += 1
-        timestamp = datetime.now().isoformat()
+        if new_quantity == self.quantity:
+            return
         self.quantity = new_quantity
-        self.change_log[f"Quantity Change #{self._quantity_change_count}"] = (
-            f"{timestamp}: Quantity updated to {new_quantity}"
-        )
+        self._record("Quantity Change", f"Quantity updated to {new_quantity}")
 
     def update_name(self, new_name: str) -> None:
         """Update the project name."""
-        self._name_change_count += 1
-        timestamp = datetime.now().isoformat()
+        if new_name == self.project_name:
+            return
         self.project_name = new_name
-        self.change_log[f"Name Change #{self._name_change_count}"] = (
-            f"{timestamp} Project name updated to {new_name}"
-        )
+        self._record("Name Change", f"Project name updated to {new_name}")
 
     def update_customer_id(self, new_customer_id: str):
         """Update the customer ID."""
-        self._customer_change_count += 1
-        timestamp = datetime.now().isoformat()
+        if new_customer_id == self.customer_id:
+            return
         self.customer_id = new_customer_id
-        self.change_log[f"Customer ID Change #{self._customer_change_count}"] = (
-            f"{timestamp} Project customer updated to {new_customer_id}"
-        )
+        self._record("Customer ID Change", f"Project customer updated to {new_customer_id}")
 
-    def update_shipping_info(self, new_shipping_info: dict):
-        """Update the shipping information."""
-        self._shipping_info_change_count += 1
-        timestamp = datetime.now().isoformat()
+    def update_shipping_info(self, new_shipping_info: Union[ShippingInfo, dict]):
+        """Update the shipping information; an {"Address", "Post Code"} dict is converted."""
+        if isinstance(new_shipping_info, dict):
+            new_shipping_info = ShippingInfo.from_dict(new_shipping_info)
+        if new_shipping_info == self.shipping_info:
+            return
         self.shipping_info = new_shipping_info
-        post_code = new_shipping_info.get('Post Code', 'Unknown')
-        self.change_log[f"Shipping Info Change #{self._shipping_info_change_count}"] = (
-            f"{timestamp} Shipping info updated to {post_code}"
-        )
+        post_code = new_shipping_info.post_code or 'Unknown'
+        self._record("Shipping Info Change", f"Shipping info updated to {post_code}")
 
     def print_comments(self) -> None:
         """Print all comments."""
@@ -267,7 +524,7 @@ class Project:
             print("No comments.")
             return
         print(f"\nComments for project {self.get_project_id()}:")
-        for comment_id, comment_text in sorted(self.comments.items()):
+        for comment_id, comment_text in self.comments.items():
             print(f"  {comment_id}: {comment_text}")
 
     def print_change_log(self) -> None:
@@ -276,8 +533,8 @@ class Project:
             print("No change log entries.")
             return
         print(f"\nChange log for project {self.get_project_id()}:")
-        for log_id, log_entry in sorted(self.change_log.items()):
-            print(f"  {log_id}: {log_entry}")
+        for entry in self.change_log:
+            print(f"  {entry}")
 
     def get_info(self) -> dict:
         """Return all available attributes as a dictionary."""
@@ -309,47 +566,400 @@ class Project:
 
 
 
+class _IndexJournal:
+    """
+    On-disk side of the project index: the snapshot, the append-only journal and
+    the background thread that appends queued records to it.
+
+    Kept apart from ProjectManager so neither the writer thread nor the exit-time
+    flush holds a reference to the manager. Errors on the writer thread are
+    logged, never printed.
+    """
+
+    def __init__(self, index_file: Path, journal_file: Path, persisted_index: Dict[str, Dict[str, str]],
+                 snapshot_unreadable: bool, protocol: int, compact_bytes: int, coalesce_seconds: float):
+        self.index_file = index_file
+        self.journal_file = journal_file
+        # Index rows as last written to disk
+        self.persisted_index = persisted_index
+        # Set when the snapshot exists but failed to load; it must not be overwritten then
+        self.snapshot_unreadable = snapshot_unreadable
+        self.protocol = protocol
+        self.compact_bytes = compact_bytes
+        self.coalesce_seconds = coalesce_seconds
+
+        self._journal = None
+        self._pending_records: List[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty_event = threading.Event()
+        self._stopping = False
+
+        self._writer = threading.Thread(target=self._writer_loop, name="ProjectIndexWriter", daemon=True)
+        self._writer.start()
+
+    def is_new_row(self, record: tuple) -> bool:
+        """Whether a record adds or removes an index row, rather than changing one already on disk."""
+        op, project_id, _, _ = record
+        return op == "drop" or project_id not in self.persisted_index
+
+    def append(self, records: List[tuple], sync: bool = False) -> None:
+        """
+        Queue records for the journal. With sync, write them (and anything queued
+        before them) now; otherwise the writer thread picks them up shortly.
+        """
+        with self._pending_lock:
+            self._pending_records.extend(records)
+        if sync or self._stopping:
+            self.flush()
+        else:
+            self._dirty_event.set()
+
+    def _writer_loop(self) -> None:
+        while not self._stopping:
+            self._dirty_event.wait()
+            if not self._stopping:
+                # Let a burst of updates pile up so it costs one write
+                time.sleep(self.coalesce_seconds)
+            self._dirty_event.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to save project index to %s", self.journal_file)
+
+    def flush(self) -> None:
+        """Write all queued records now. On failure they stay queued and the error is raised."""
+        with self._write_lock:
+            with self._pending_lock:
+                records, self._pending_records = self._pending_records, []
+            if not records:
+                return
+
+            try:
+                if self._journal is None:
+                    self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._journal = open(self.journal_file, "ab", buffering=0)
+                self._journal.write(b"".join(pickle.dumps(r, protocol=self.protocol) for r in records))
+            except BaseException:
+                with self._pending_lock:
+                    self._pending_records[:0] = records
+                raise
+
+            for record in records:
+                ProjectManager._apply_journal_record(self.persisted_index, record)
+            if self._journal.tell() > self.compact_bytes:
+                self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        """Atomically rewrite the full index snapshot and empty the journal."""
+        if self.snapshot_unreadable:
+            # Keep appending to the journal instead of replacing the unreadable snapshot
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        with _atomic_write(self.index_file) as f:
+            pickle.dump(self.persisted_index, f, protocol=self.protocol)
+
+        if self._journal is not None:
+            self._journal.truncate(0)
+        elif self.journal_file.exists():
+            self.journal_file.unlink()
+
+    def close(self) -> None:
+        """Stop the writer thread and write whatever is still queued."""
+        self._stopping = True
+        self._dirty_event.set()
+        self._writer.join()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to save project index to %s", self.journal_file)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
 class ProjectManager:
+    # Pickle protocol 5 adds framing and out-of-band buffers (PEP 574)
+    PICKLE_PROTOCOL = 5
+    # Number of unpickled projects kept in memory
+    PROJECT_CACHE_SIZE = 128
+    # Compact the index journal into a fresh snapshot once it grows past this size
+    JOURNAL_COMPACT_BYTES = 1024 * 1024
+    # Delay before the background writer flushes, so bursts of updates share one write
+    WRITE_COALESCE_SECONDS = 0.05
+
     def __init__(self, index_file: Path, projects_dir: Path):
         self.index_file = index_file
+        self.journal_file = index_file.with_suffix(".journal")
         self.projects_dir = projects_dir
-        self.projects_index = pd.DataFrame(columns=["project_id", "filename", "status"]).set_index("project_id")
-        self._load_index()
+        self.projects_index: Dict[str, Dict[str, str]] = {}
+        self._project_cache: "OrderedDict[str, Project]" = OrderedDict()
+        self._bulk_depth = 0
+        self._bulk_dirty_ids: Set[str] = set()
+        self._bulk_projects: Dict[str, Tuple[Project, Path]] = {}
+        # (new ID, old ID, old pickle path) of renamed projects; the old pickle is removed
+        # and the old index row dropped only once the new pickle is saved
+        self._bulk_removals: List[Tuple[str, str, Path]] = []
+
+        snapshot_unreadable = self._load_index()
+        self._index = _IndexJournal(
+            self.index_file, self.journal_file, {k: dict(v) for k, v in self.projects_index.items()},
+            snapshot_unreadable, self.PICKLE_PROTOCOL, self.JOURNAL_COMPACT_BYTES, self.WRITE_COALESCE_SECONDS,
+        )
+        # Flushes the journal when the manager is collected or at interpreter exit, without pinning it
+        self._finalizer = weakref.finalize(self, self._index.close)
+
+    @staticmethod
+    def _project_filename(project_id: str) -> str:
+        """Derive the on-disk pickle name for a project ID (8-byte BLAKE2b digest)."""
+        return hashlib.blake2b(project_id.encode("utf-8"), digest_size=8).hexdigest() + ".pkl"
 
     def _project_path(self, project_id: str, create_if_missing: bool = False) -> Path:
-        if project_id not in self.projects_index.index:
+        if project_id not in self.projects_index:
             if create_if_missing:
-                hash_str = hashlib.md5(project_id.encode()).hexdigest()
-                filename = f"{hash_str}.pkl"
-                self.projects_index.loc[project_id] = [filename, "Created"]
+                filename = self._project_filename(project_id)
+                self.projects_index[project_id] = {"filename": filename, "status": "Created"}
 
             else:
                 raise KeyError(f"[ERROR] Project ID '{project_id}' not found in index.")
 
-        filename = self.projects_index.loc[project_id, "filename"]
+        filename = self.projects_index[project_id]["filename"]
         return self.projects_dir / filename
 
-    def _load_index(self) -> None:
+    @staticmethod
+    def migrate_legacy_index(index_file: Path) -> None:
+        """
+        Convert an index snapshot pickled as a pandas DataFrame into the plain dict format.
+
+        Needs pandas installed, once, to unpickle the old snapshot. The original is
+        kept next to it with a ".pandas.bak" suffix.
+        """
+        index_file = Path(index_file)
+        index = _load_pickle(index_file)
+        if isinstance(index, dict):
+            print(f"[INFO] {index_file} is already a dict index, nothing to migrate.")
+            return
+        index = {str(k): {"filename": row["filename"], "status": row["status"]}
+                 for k, row in index.to_dict(orient="index").items()}
+
+        shutil.copy2(index_file, index_file.with_suffix(".pandas.bak"))
+        with _atomic_write(index_file) as f:
+            pickle.dump(index, f, protocol=ProjectManager.PICKLE_PROTOCOL)
+        print(f"[INFO] Migrated {len(index)} project(s) in {index_file} to the dict index format.")
+
+    def _load_index(self) -> bool:
+        """Load the snapshot and replay the journal. Returns True if the snapshot exists but could not be read."""
+        snapshot_unreadable = False
         if self.index_file.exists():
             try:
-                with open(self.index_file, "rb") as f:
-                    self.projects_index = pickle.load(f)
+                index = _load_pickle(self.index_file)
+                if not isinstance(index, dict):
+                    # Snapshots written before the dict index held a pandas DataFrame
+                    index = index.to_dict(orient="index")
+                self.projects_index = index
+
+            except ModuleNotFoundError as e:
+                if e.name is None or e.name.split(".")[0] != "pandas":
+                    raise
+                raise RuntimeError(
+                    f"{self.index_file} is a legacy pandas project index. Install pandas once and run "
+                    f"'python ProjectManager.py migrate-index {self.index_file}' to convert it."
+                ) from e
 
             except Exception as e:
-                print(f"[ERROR] Failed to load project index: {e}")
+                # Never compact over a snapshot we could not read, or its projects are lost for good
+                snapshot_unreadable = True
+                print(f"[ERROR] Failed to load project index, leaving {self.index_file} untouched: {e}")
 
-    def _update_index(self) -> None:
-        try:
-            self.index_file.parent.mkdir(parents=True, exist_ok=True)
-            temp_file = self.index_file.with_suffix(".tmp")
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, "rb") as f:
+                    while True:
+                        try:
+                            record = pickle.load(f)
+                        except EOFError:
+                            break
+                        self._apply_journal_record(self.projects_index, record)
+
+            except Exception as e:
+                print(f"[ERROR] Failed to replay project index journal: {e}")
+
+        return snapshot_unreadable
+
+    @staticmethod
+    def _apply_journal_record(index: Dict[str, Dict[str, str]], record: tuple) -> None:
+        op, project_id, filename, status = record
+        if op == "put":
+            index[project_id] = {"filename": filename, "status": status}
+        elif op == "drop":
+            index.pop(project_id, None)
+
+    def _index_record(self, project_id: str, op: str = "put") -> tuple:
+        if op == "put":
+            row = self.projects_index[project_id]
+            return (op, project_id, row["filename"], row["status"])
+        return (op, project_id, None, None)
+
+    def _update_index(self, project_id: str, op: str = "put") -> None:
+        """
+        Record a single index change in the journal.
+
+        Rows that are added or dropped are written before this returns, so the
+        index never lags behind a pickle that was just created or removed. Status
+        changes to an existing row are left to the background writer, which
+        appends a burst of them in one write. The full snapshot is rewritten once
+        the journal exceeds JOURNAL_COMPACT_BYTES. Inside bulk() the change is
+        only remembered and written on exit.
+        """
+        if self._bulk_depth:
+            self._bulk_dirty_ids.add(project_id)
+            if op == "drop":
+                self._bulk_projects.pop(project_id, None)
+            return
 
-            with open(temp_file, "wb") as f:
-                pickle.dump(self.projects_index, f)
-            os.replace(temp_file, self.index_file)
+        record = self._index_record(project_id, op)
+        self._index.append([record], sync=self._index.is_new_row(record))
 
+    def flush(self) -> None:
+        """Write all queued index changes to disk now."""
+        try:
+            self._index.flush()
         except Exception as e:
             print(f"[ERROR] Failed to save project index: {e}")
 
+    def close(self) -> None:
+        """Flush queued index changes and stop the background writer."""
+        self._finalizer()
+
+    @staticmethod
+    def _buffers_path(project_path: Path) -> Path:
+        return project_path.with_suffix(".bufs")
+
+    def _save_project(self, project: Project, project_path: Path) -> None:
+        """
+        Pickle a project, storing any out-of-band buffers in a length-prefixed
+        .bufs sidecar so large binary payloads are written without copying.
+        """
+        buffers = []
+        with _atomic_write(project_path) as f:
+            pickle.dump(project, f, protocol=self.PICKLE_PROTOCOL, buffer_callback=buffers.append)
+
+            # Put the sidecar in place before the pickle that refers to it
+            buffers_path = self._buffers_path(project_path)
+            if buffers:
+                with _atomic_write(buffers_path) as bf:
+                    for buffer in buffers:
+                        raw = buffer.raw()
+                        bf.write(struct.pack("<Q", raw.nbytes))
+                        bf.write(raw)
+            elif buffers_path.exists():
+                buffers_path.unlink()
+
+    def _store_project(self, project_id: str, project: Project, project_path: Path) -> None:
+        """Save a project now, or queue it until the outermost bulk() block exits."""
+        if self._bulk_depth:
+            self._bulk_dirty_ids.add(project_id)
+            self._bulk_projects[project_id] = (project, project_path)
+            return
+        self._save_project(project, project_path)
+
+    @contextmanager
+    def bulk(self):
+        """
+        Defer project saves and index writes until the block exits.
+
+        Usage:
+            with pm.bulk():
+                pm.update_project("HAM_1", "update_status", "Printing")
+                pm.update_project("HAM_2", "update_status", "Printing")
+
+        Each touched project is pickled once and its final index row is queued
+        once, instead of once per call. Blocks may be nested.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self._flush_dirty()
+
+    def _flush_dirty(self) -> None:
+        """
+        Save the projects queued by bulk(), remove the pickles they were renamed
+        from and queue their index rows.
+
+        Every save is attempted. A project that fails to save stays queued, along
+        with its old pickle and index rows, and is retried when the next bulk() exits.
+        """
+        if not self._bulk_dirty_ids:
+            return
+
+        failed: Dict[str, Tuple[Project, Path]] = {}
+        saved_paths: Set[Path] = set()
+        for project_id, (project, project_path) in self._bulk_projects.items():
+            if project_id not in self.projects_index:
+                continue
+            try:
+                self._save_project(project, project_path)
+                saved_paths.add(project_path)
+            except Exception as e:
+                failed[project_id] = (project, project_path)
+                print(f"[ERROR] Failed to save project {project_id}, keeping it queued: {e}")
+
+        # Old pickles of renamed projects go only once their new pickles are on disk
+        pending_removals = []
+        held_ids = set(failed)
+        for removal in self._bulk_removals:
+            new_project_id, old_project_id, old_path = removal
+            if new_project_id in failed:
+                pending_removals.append(removal)
+                held_ids.add(old_project_id)
+            elif old_path not in saved_paths:
+                # Renamed back to the original ID: the path now holds the freshly saved pickle
+                try:
+                    self._remove_project_files(old_path)
+                except Exception as e:
+                    print(f"[ERROR] Failed to remove old project file {old_path}: {e}")
+
+        written_ids = self._bulk_dirty_ids - held_ids
+        records = [self._index_record(project_id, op="put" if project_id in self.projects_index else "drop")
+                   for project_id in written_ids]
+        if records:
+            try:
+                self._index.append(records, sync=any(self._index.is_new_row(r) for r in records))
+                print(f"[INFO] Saved {len(written_ids)} project change(s) in bulk.")
+            except Exception as e:
+                print(f"[ERROR] Failed to save project index, changes stay queued: {e}")
+
+        self._bulk_projects = failed
+        self._bulk_dirty_ids = self._bulk_dirty_ids & held_ids
+        self._bulk_removals = pending_removals
+
+    def _load_project(self, project_path: Path) -> Project:
+        buffers = []
+        buffers_path = self._buffers_path(project_path)
+        if buffers_path.exists():
+            data = memoryview(buffers_path.read_bytes())
+            offset = 0
+            while offset < len(data):
+                (size,) = struct.unpack_from("<Q", data, offset)
+                offset += 8
+                buffers.append(data[offset:offset + size])
+                offset += size
+
+        return _load_pickle(project_path, buffers=buffers)
+
+    def _remove_project_files(self, project_path: Path) -> bool:
+        """Delete a project pickle and its buffer sidecar. Returns whether the pickle existed."""
+        buffers_path = self._buffers_path(project_path)
+        if buffers_path.exists():
+            buffers_path.unlink()
+        if project_path.exists():
+            project_path.unlink()
+            return True
+        return False
+
     def create_project(
         self,
         master_id: str,
@@ -368,34 +978,31 @@ class ProjectManager:
             quantity=quantity,
         )
         project_id = project.get_project_id()
-        if project_id in self.projects_index.index:
+        if project_id in self.projects_index:
             print(f"[ERROR] Cannot create duplicate project: '{project_id}' already exists.")
             return
 
         project_path = self._project_path(project_id, create_if_missing=True)
-        self.projects_index.loc[project_id, "status"] = project.status
-        self.projects_index.loc[project_id, "filename"] = project_path.name
+        self.projects_index[project_id] = {"filename": project_path.name, "status": project.status}
 
         try:
             project_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(project_path, "wb") as f:
-                pickle.dump(project, f)
-            self._update_index()
+            self._store_project(project_id, project, project_path)
+            self._cache_project(project_id, project)
+            self._update_index(project_id)
             print(f"[INFO] Project {project_id} created and saved successfully.")
 
         except Exception as e:
             print(f"[ERROR] Failed to create project {project_id}: {e}")
 
     def delete_project(self, project_id: str) -> None:
-        if project_id not in self.projects_index.index:
+        if project_id not in self.projects_index:
             print(f"[WARNING] Project ID '{project_id}' not found. Nothing to delete.")
             return
 
         try:
             project_file = self._project_path(project_id)
-            if project_file.exists():
-                project_file.unlink()
+            if self._remove_project_files(project_file):
                 print(f"[INFO] Deleted project file for '{project_id}'.")
             else:
                 print(f"[WARNING] Project file for '{project_id}' does not exist on disk.")
@@ -403,37 +1010,59 @@ class ProjectManager:
             print(f"[ERROR] Failed to delete project file for '{project_id}': {e}")
             return
 
-        self.projects_index.drop(project_id, inplace=True)
+        del self.projects_index[project_id]
+        self._project_cache.pop(project_id, None)
         try:
-            self._update_index()
+            self._update_index(project_id, op="drop")
             print(f"[INFO] Project '{project_id}' removed from index.")
         except Exception as e:
             print(f"[ERROR] Failed to update project index after deletion: {e}")
 
     def _get_project(self, project_id: str) -> Optional["Project"]:
-        if project_id not in self.projects_index.index:
+        if project_id not in self.projects_index:
             print(f"[WARNING] Project ID '{project_id}' not found.")
             return None
 
+        if self._bulk_depth and project_id in self._bulk_projects:
+            # Inside bulk() the queued object is newer than the pickle, and may have left the cache
+            project = self._bulk_projects[project_id][0]
+            self._cache_project(project_id, project)
+            return project
+
+        project = self._project_cache.get(project_id)
+        if project is not None:
+            self._project_cache.move_to_end(project_id)
+            return project
+
         try:
-            with open(self._project_path(project_id), "rb") as f:
-                return pickle.load(f)
+            project = self._load_project(self._project_path(project_id))
 
         except Exception as e:
             print(f"[ERROR] Failed to load project {project_id}: {e}")
             return None
 
-    def update_project(self, project_id: str, action: str, info: Union[str, int, float, dict, list]) -> None:
+        self._cache_project(project_id, project)
+        return project
+
+    def _cache_project(self, project_id: str, project: Project) -> None:
+        self._project_cache[project_id] = project
+        self._project_cache.move_to_end(project_id)
+        if len(self._project_cache) > self.PROJECT_CACHE_SIZE:
+            self._project_cache.popitem(last=False)
+
+    def update_project(self, project_id: str, action: str, info: Union[str, int, float, dict, list]) -> Optional[str]:
+        """Apply one update and return the project's (possibly new) ID, or None on failure."""
         project = self._get_project(project_id)
         if not project:
             print(f"[ERROR] Project {project_id} could not be loaded.")
-            return
+            return None
 
         method = getattr(project, action, None)
         if not method or not callable(method):
             print(f"[ERROR] Action '{action}' not valid for Project.")
-            return
+            return None
 
+        log_length = len(project.change_log)
         try:
             if isinstance(info, dict):
                 method(**info)
@@ -442,44 +1071,83 @@ class ProjectManager:
             else:
                 method(info)
         except Exception as e:
+            # The cached object may be partially modified, reload it from disk next time
+            self._project_cache.pop(project_id, None)
             print(f"[ERROR] Failed to apply '{action}' to {project_id}: {e}")
-            return
+            return None
+
+        if len(project.change_log) == log_length:
+            print(f"[INFO] Project {project_id} unchanged by '{action}', nothing to save.")
+            return project_id
 
         new_project_id = project.get_project_id()
-        new_filename = hashlib.md5(new_project_id.encode()).hexdigest() + ".pkl"
-        new_path = self.projects_dir / new_filename
+        if new_project_id == project_id:
+            # Keep the indexed filename so projects saved under older naming schemes stay valid
+            new_path = self._project_path(project_id)
+            new_filename = new_path.name
+        else:
+            new_filename = self._project_filename(new_project_id)
+            new_path = self.projects_dir / new_filename
 
         try:
             # Save project to new file
-            with open(new_path, "wb") as f:
-                pickle.dump(project, f)
+            self._store_project(new_project_id, project, new_path)
 
             # Update index
             if new_project_id != project_id:
                 # Remove old entry
-                if project_id in self.projects_index.index:
+                if project_id in self.projects_index:
                     old_path = self._project_path(project_id)
-                    self.projects_index.drop(index=project_id, inplace=True, errors="ignore")
-                    if old_path.exists():
-                        old_path.unlink()
-                        print(f"[INFO] Project id updated from {project_id} to {new_project_id}.")
+                    del self.projects_index[project_id]
+                    self._project_cache.pop(project_id, None)
+                    self._update_index(project_id, op="drop")
+                    if self._bulk_depth:
+                        # The new pickle is only written when bulk() exits, keep the old one until then
+                        self._bulk_removals.append((new_project_id, project_id, old_path))
+                    else:
+                        self._remove_project_files(old_path)
+                    print(f"[INFO] Project id updated from {project_id} to {new_project_id}.")
 
                 # Add new entry
-                self.projects_index.loc[new_project_id] = [new_filename, project.status]
+                self.projects_index[new_project_id] = {"filename": new_filename, "status": project.status}
+                self._cache_project(new_project_id, project)
             else:
                 # Update status only
-                self.projects_index.loc[project_id, "status"] = project.status
+                self.projects_index[project_id]["status"] = project.status
 
-            self._update_index()
+            self._update_index(new_project_id)
             print(f"[INFO] Project {new_project_id} updated successfully via '{action}'.")
+            return new_project_id
 
         except Exception as e:
+            self._project_cache.pop(project_id, None)
+            self._project_cache.pop(new_project_id, None)
             print(f"[ERROR] Failed to save updated project {new_project_id}: {e}")
+            return None
+
+    def update_project_batch(self, project_id: str, changes: List[Tuple[str, Union[str, int, float, dict, list]]]) -> Optional[str]:
+        """
+        Apply several (action, info) updates to one project, saving it once.
+
+        Actions run in order through update_project inside a bulk() block, so the
+        project is pickled and its index row queued once for the whole batch.
+        Later actions follow the project if an earlier one changes its ID, and the
+        batch stops at the first failing action. Returns the final project ID, or
+        None if an action failed.
+        """
+        with self.bulk():
+            for action, info in changes:
+                new_project_id = self.update_project(project_id, action, info)
+                if new_project_id is None:
+                    print(f"[ERROR] Stopped batch update of {project_id} at '{action}'.")
+                    return None
+                project_id = new_project_id
+        return project_id
 
     def get_project_list(self) -> List[str]:
-        return self.projects_index.index.tolist()
+        return list(self.projects_index)
 
-    def get_project_change_log(self, project_id: str, show_in_terminal: bool = False) -> Dict[str, str]:
+    def get_project_change_log(self, project_id: str, show_in_terminal: bool = False) -> List[ChangeLogEntry]:
         project = self._get_project(project_id)
         change_log = project.change_log
         print("[INFO] Getting project change log...")
@@ -494,3 +1162,10 @@ class ProjectManager:
     def print_project_info(self, project_id: str, comment: bool = False, change_log: bool = False) -> None:
         project = self._get_project(project_id)
         project.print_info(comment=comment, change_log=change_log)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "migrate-index":
+        ProjectManager.migrate_legacy_index(Path(sys.argv[2]))
+    else:
+        sys.exit("usage: python ProjectManager.py migrate-index <project_index.pkl>")
@@ -1,8 +1,32 @@
+import json
 from pathlib import Path
+from ProjectManager import ShippingInfo
 
 BASE_DIR = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/")/ "tests/GUI_test"
 PROJECTS_DIR = BASE_DIR / "projects"
 INDEX_FILE = BASE_DIR / "project_index.pkl"
 UPDATE_METHODS = ["update_master_id", "update_sub_id", "update_file", "update_file_directories", "update_status",
                   "update_quantity", "update_responsibility", "delete_responsibility", "update_name",
-                  "update_customer_id", "update_shipping_info"]
\ No newline at end of file
+                  "update_customer_id", "update_shipping_info"]
+
+
+def _parse_shipping_info(value: str) -> dict:
+    """Parse a JSON object such as {"Address": "...", "Post Code": "..."} into update_shipping_info kwargs."""
+    shipping_info = json.loads(value)
+    if not isinstance(shipping_info, dict):
+        raise ValueError('expected a JSON object such as {"Address": "...", "Post Code": "..."}')
+    # Checked here so a wrong key is reported by the edit dialog, not just logged
+    return {"new_shipping_info": ShippingInfo.from_dict(shipping_info)}
+
+
+# Converts the text typed into the GUI into the argument for each single-value update method
+UPDATE_METHOD_PARSERS = {
+    "update_master_id": str,
+    "update_sub_id": int,
+    "update_status": str,
+    "update_quantity": int,
+    "delete_responsibility": str,
+    "update_name": str,
+    "update_customer_id": str,
+    "update_shipping_info": _parse_shipping_info,
+}
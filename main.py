@@ -1,32 +1,307 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
-from config import PROJECTS_DIR, INDEX_FILE, UPDATE_METHODS
+import tkinter.font as tkfont
+from tkinter import messagebox, ttk
+from config import PROJECTS_DIR, INDEX_FILE, UPDATE_METHODS, UPDATE_METHOD_PARSERS
 from ProjectManager import ProjectManager
+from collections import deque
+from functools import wraps
+import logging
+import os
+import re
 import sys
 
 
+# Separator for comma-separated name lists, swallowing surrounding whitespace
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def _split_names(names_str):
+    """
+    Split a comma-separated string into a list of non-empty, stripped names.
+    """
+    return [name for name in _CSV_RE.split(names_str.strip(", \t\r\n")) if name]
+
+
 #TODO: Add view button, open project file and view stl
 #TODO: Add edit comment button
 
 class TextRedirector:
     """
     Redirect stdout and stderr to a Tkinter Text widget.
+
+    Writes are buffered and inserted once per idle cycle, and the widget keeps at
+    most max_lines lines.
     """
-    def __init__(self, widget):
+    def __init__(self, widget, max_lines=5000):
         self.widget = widget
+        self.max_lines = max_lines
+        self._buf = deque()
+        self._pending = False
 
     def write(self, message):
-        self.widget.insert(tk.END, message)
+        self._buf.append(message)
+        if not self._pending:
+            self._pending = True
+            self.widget.after_idle(self._flush)
+
+    def _flush(self):
+        self._pending = False
+        if not self._buf:
+            return
+        parts = []
+        while self._buf:
+            parts.append(self._buf.popleft())
+        self.widget.insert(tk.END, "".join(parts))
+
+        line_count = int(self.widget.index("end-1c").split(".")[0])
+        if line_count > self.max_lines:
+            self.widget.delete("1.0", f"end-{self.max_lines}l")
         self.widget.see(tk.END)
 
     def flush(self):
-        pass  # Required for compatibility with sys.stdout
+        self._flush()
+
+
+class VirtualListView:
+    """
+    Scrollable list that only materializes the rows currently in view.
+
+    The full sequence stays on the Python side and rows are formatted on demand,
+    so opening and scrolling cost O(visible rows) regardless of the list length.
+    """
+    # Font description -> line height in pixels
+    _line_heights = {}
+
+    def __init__(self, master, items, formatter=str, **listbox_options):
+        self.items = items
+        self.formatter = formatter
+        self.first = 0
+
+        self.frame = tk.Frame(master)
+        self.scrollbar = tk.Scrollbar(self.frame, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox = tk.Listbox(self.frame, activestyle="none", **listbox_options)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._line_height = self._font_line_height(self.listbox.cget("font"))
+
+        self.listbox.bind("<Configure>", lambda event: self._render())
+        # The handlers return "break" so the Listbox class bindings do not also scroll its own view
+        self.listbox.bind("<MouseWheel>", self._on_mousewheel)
+        self.listbox.bind("<Button-4>", lambda event: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda event: self._scroll_by(3))
+        self._render()
+
+    @classmethod
+    def _font_line_height(cls, font):
+        """
+        Line height of a listbox font, measured once per font rather than once per popup.
+        """
+        font = str(font)
+        if font not in cls._line_heights:
+            try:
+                # Listboxes normally use a named font such as TkDefaultFont, reuse it
+                measured = tkfont.nametofont(font)
+            except tk.TclError:
+                measured = tkfont.Font(font=font)
+            cls._line_heights[font] = max(1, measured.metrics("linespace"))
+        return cls._line_heights[font]
+
+    def _visible_rows(self):
+        """
+        Number of rows that fit entirely inside the listbox.
+        """
+        height = self.listbox.winfo_height()
+        if height <= 1:
+            # Not laid out yet
+            return int(self.listbox.cget("height"))
+        # Tk lays rows out linespace + 1 + 2 * selectborderwidth apart, inside the border and highlight ring
+        inset = 2 * (int(self.listbox.cget("borderwidth")) + int(self.listbox.cget("highlightthickness")))
+        pitch = self._line_height + 1 + 2 * int(self.listbox.cget("selectborderwidth"))
+        return max(1, (height - inset) // pitch)
+
+    def scroll_to(self, first):
+        rows = self._visible_rows()
+        self.first = max(0, min(first, len(self.items) - rows))
+        self._render()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if args[2] == "pages" else 1
+            self.scroll_to(self.first + int(args[1]) * step)
+
+    def _scroll_by(self, rows):
+        self.scroll_to(self.first + rows)
+        return "break"
+
+    def _on_mousewheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _render(self):
+        rows = self._visible_rows()
+        window = self.items[self.first:self.first + rows]
+        self.listbox.delete(0, tk.END)
+        if window:
+            self.listbox.insert(tk.END, *(self.formatter(item) for item in window))
+        if self.items:
+            total = len(self.items)
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+class ReusableSelectionDialog:
+    """
+    Modal option picker built once and shown again on every request.
+
+    The Toplevel is withdrawn instead of destroyed on confirm, so later openings
+    only update the label and menu entries instead of rebuilding the widgets.
+    """
+    def __init__(self, master, title, geometry="300x200"):
+        self.popup = tk.Toplevel(master)
+        self.popup.title(title)
+        self.popup.geometry(geometry)
+        self.popup.protocol("WM_DELETE_WINDOW", self.hide)
+        self.popup.withdraw()
+
+        self.label = tk.Label(self.popup)
+        self.label.pack(pady=10)
+        self.var = tk.StringVar(self.popup)
+        self.menu = tk.OptionMenu(self.popup, self.var, "")
+        self.menu.pack(pady=5)
+        tk.Button(self.popup, text="Confirm", command=self._on_confirm).pack(pady=10)
+
+        self._options = None
+        self._callback = None
+
+    def show(self, message, options_list, callback):
+        """
+        Show the dialog and call callback(choice) once the user confirms.
+        """
+        self.label.config(text=message)
+        if options_list != self._options:
+            menu = self.menu["menu"]
+            menu.delete(0, tk.END)
+            for opt in options_list:
+                menu.add_command(label=opt, command=tk._setit(self.var, opt))
+            self._options = list(options_list)
+        self.var.set(options_list[0])
+        self._callback = callback
+        self.popup.deiconify()
+        self.popup.grab_set()  # Modal window
+
+    def hide(self):
+        self.popup.grab_release()
+        self.popup.withdraw()
+
+    def _on_confirm(self):
+        choice = self.var.get()
+        callback, self._callback = self._callback, None
+        self.hide()
+        if callback is not None:
+            callback(choice)
+
+
+class ReusableTextWindow:
+    """
+    Non-modal read-only text window that is created once and updated in place.
+
+    Closing the window only withdraws it, and the text is only rewritten when
+    it differs from what is already shown.
+    """
+    def __init__(self, master, geometry="400x300"):
+        self.window = tk.Toplevel(master)
+        self.window.geometry(geometry)
+        self.window.protocol("WM_DELETE_WINDOW", self.window.withdraw)
+
+        scrollbar = tk.Scrollbar(self.window)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(self.window, wrap="word", state="disabled", yscrollcommand=scrollbar.set)
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        scrollbar.config(command=self.text.yview)
+        self._shown = None
+
+    def is_visible(self):
+        return bool(self.window.winfo_viewable())
+
+    def show(self, title, text):
+        self.window.title(title)
+        if text != self._shown:
+            self.text.config(state="normal")
+            self.text.delete("1.0", tk.END)
+            self.text.insert(tk.END, text)
+            self.text.config(state="disabled")
+            self._shown = text
+        self.window.deiconify()
+        self.window.lift()
+
+
+# (kind, project_id) -> (index stamp, value) for project lookups shown in popups
+_info_cache = {}
+
+# Project info window, created on first use
+_info_window = None
+
+# Shared popup heading font, created once root exists
+_HEADING_FONT = None
+
+# Project IDs currently shown in the listbox
+_last_pids = None
+
+# Project ID selected in the listbox, updated on <<ListboxSelect>>
+_selected_pid = None
+
+
+def _on_listbox_select(event):
+    global _selected_pid
+    selection = listbox.curselection()
+    _selected_pid = listbox.get(selection[0]) if selection else None
+    # Follow the selection while the info window is open
+    if _selected_pid and _info_window is not None and _info_window.is_visible():
+        show_project_info()
+
+
+def _current_selection():
+    """
+    Return the selected project ID, or None if nothing is selected.
+    """
+    return _selected_pid
+
+
+def _index_stamp():
+    """
+    Return the modification times of the index snapshot and journal, or None if missing.
+    """
+    stamp = []
+    for path in (pm.index_file, pm.journal_file):
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _cached_lookup(kind, project_id, loader):
+    """
+    Return loader(project_id), reusing the previous result while the index is unchanged.
+    """
+    stamp = _index_stamp()
+    cached = _info_cache.get((kind, project_id))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = loader(project_id)
+    _info_cache[(kind, project_id)] = (stamp, value)
+    return value
 
 
 def get_responsibility_dict(single_pair: bool=False):
     """
     Prompt user to input responsibility roles and associated people/companies.
     """
+    # Dialog modules are only imported once a handler needs them
+    from tkinter import simpledialog
+
     if single_pair:
         resp_type = simpledialog.askstring("Responsibility Type",
                                            "Enter responsibility type (e.g. Designer, Factory, Shipping):",
@@ -41,7 +316,7 @@ def get_responsibility_dict(single_pair: bool=False):
         )
         if people_str is None:
             return
-        people_list = [name.strip() for name in people_str.split(",") if name.strip()]
+        people_list = _split_names(people_str)
         if not people_list:
             return
 
@@ -61,7 +336,7 @@ def get_responsibility_dict(single_pair: bool=False):
                 "People Responsible",
                 f"List people/company responsible for {resp_type} (comma-separated):"
             )
-            responsibility[resp_type] = [name.strip() for name in people.split(",")] if people else []
+            responsibility[resp_type] = _split_names(people) if people else []
         return responsibility
 
 
@@ -70,6 +345,8 @@ def create_project():
     Prompt user for project creation details and create a new project via ProjectManager.
     Stops and shows a warning if any required field is empty.
     """
+    from tkinter import filedialog, simpledialog
+
     master_id = simpledialog.askstring("Input", "Master ID (e.g., HAM, MAAS)")
     if not master_id:
         messagebox.showwarning("Missing Input", "Master ID is required.")
@@ -100,37 +377,25 @@ def create_project():
         return
 
     pm.create_project(master_id, sub_id, file_path, archive_dir, responsibility, quantity)
+    _info_cache.clear()
     refresh_project_list()
 
 
 def edit():
-    selected = listbox.get(tk.ACTIVE)
+    from tkinter import filedialog, simpledialog
+
+    selected = _current_selection()
     if not selected:
         messagebox.showwarning("No Selection", "Select a project to edit.")
         return
 
-    # --- Create a popup window for selection ---
-    popup = tk.Toplevel(root)
-    popup.title("Select Update Method")
-    popup.geometry("300x200")
-    popup.grab_set()  # Modal window
-
-    tk.Label(popup, text="Select method to update:").pack(pady=10)
-
-    selected_method = tk.StringVar(popup)
-    selected_method.set(UPDATE_METHODS[0])  # Default selection
-
-    tk.OptionMenu(popup, selected_method, *UPDATE_METHODS).pack(pady=5)
-
-    def on_confirm():
-        action = selected_method.get()
-        popup.destroy()
-
+    def on_confirm(action):
         # Handle 'update_responsibility' separately
         if action == "update_responsibility":
             info = get_responsibility_dict(single_pair=True)
-            if info:
-                pm.update_project(selected, action, info)
+            # update_project reports and skips no-op updates itself; None means it failed
+            if info and pm.update_project(selected, action, info) is not None:
+                _info_cache.clear()
                 refresh_project_list()
             return
 
@@ -158,6 +423,8 @@ def edit():
             else:
                 new_archive_path = None
 
+            if new_file_path is None and new_archive_path is None:
+                return
             info = {"new_file_path": new_file_path, "new_archive_path": new_archive_path}
 
         else:
@@ -166,78 +433,118 @@ def edit():
             if info_str is None:
                 return
 
+            parser = UPDATE_METHOD_PARSERS.get(action, str)
             try:
-                info = eval(info_str, {"__builtins__": {}})
-            except Exception:
-                info = info_str
+                info = parser(info_str)
+            except ValueError as e:
+                messagebox.showerror("Invalid Input", f"Invalid value for '{action}': {e}")
+                return
 
-        pm.update_project(selected, action, info)
-        refresh_project_list()
+        if pm.update_project(selected, action, info) is not None:
+            _info_cache.clear()
+            refresh_project_list()
+
+    selection_dialog.show("Select method to update:", UPDATE_METHODS, on_confirm)
+
+
+def _debounce(fn, delay=50):
+    """
+    Wrap fn so that a burst of calls within delay ms runs it once, after the last call.
+    """
+    pending = None
+
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        nonlocal pending
+        if pending is not None:
+            root.after_cancel(pending)
+
+        def run():
+            nonlocal pending
+            pending = None
+            fn(*args, **kwargs)
+
+        pending = root.after(delay, run)
+
+    return wrapped
 
 
 def refresh_project_list():
     """
     Refresh the displayed list of projects in the Listbox.
     """
+    global _last_pids, _selected_pid
+    project_ids = tuple(pm.get_project_list())
+    if project_ids == _last_pids:
+        # Nothing changed, keep the current rows (and selection) as they are
+        return
+    _last_pids = project_ids
+
+    # Deleting the rows drops the selection along with them
+    _selected_pid = None
     listbox.delete(0, tk.END)
-    for pid in pm.get_project_list():
-        listbox.insert(tk.END, pid)
+    if project_ids:
+        # One Tcl call for the whole list instead of one per project
+        listbox.insert(tk.END, *project_ids)
+
+
+# Rapid edits/deletes trigger a single refresh
+refresh_project_list = _debounce(refresh_project_list)
+
+
+def _format_project_info(project_id):
+    info = _cached_lookup("info", project_id, pm.get_project_info)
+    return "\n".join(f"{k}: {v}" for k, v in info.items())
 
 
 def show_project_info():
     """
-    Display detailed information about the selected project.
+    Display detailed information about the selected project in a reusable, non-modal window.
     """
-    selected = listbox.get(tk.ACTIVE)
+    global _info_window
+    selected = _current_selection()
     if not selected:
         return
-    info = pm.get_project_info(selected)
-    info_str = "\n".join(f"{k}: {v}" for k, v in info.items())
-    messagebox.showinfo(f"Project Info: {selected}", info_str)
+    info_str = _cached_lookup("info_text", selected, _format_project_info)
+    if _info_window is None:
+        _info_window = ReusableTextWindow(root)
+    _info_window.show(f"Project Info: {selected}", info_str)
 
 
 def get_project_change_log():
     """"""
-    selected = listbox.get(tk.ACTIVE)
+    selected = _current_selection()
     if not selected:
         return
-    info = pm.get_project_change_log(selected)
+    info = _cached_lookup("change_log", selected, pm.get_project_change_log)
     if not info:
         messagebox.showinfo("Change Log", "No change log found for this project.")
         return
 
-    # Format the log as a multiline string
-    log_str = "\n".join(f"{cid}: {desc}" for cid, desc in info.items())
-
-    # Show in a scrollable popup
+    # Show in a scrollable popup; entries are only formatted once they scroll into view
     log_popup = tk.Toplevel(root)
     log_popup.title(f"Change Log: {selected}")
     log_popup.geometry("400x300")
     log_popup.grab_set()
 
-    tk.Label(log_popup, text="Change Log", font=("Arial", 12, "bold")).pack(pady=5)
-
-    text_widget = tk.Text(log_popup, wrap=tk.WORD)
-    text_widget.insert(tk.END, log_str)
-    text_widget.config(state=tk.DISABLED)
-    text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    ttk.Label(log_popup, text="Change Log", font=_HEADING_FONT).pack(pady=5)
 
-    scrollbar = tk.Scrollbar(text_widget, command=text_widget.yview)
-    text_widget.config(yscrollcommand=scrollbar.set)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    log_view = VirtualListView(log_popup, info)
+    log_view.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
 
 def delete_project():
     """
     Delete the selected project after confirmation from the user.
     """
-    selected = listbox.get(tk.ACTIVE)
+    selected = _current_selection()
     if not selected:
         messagebox.showwarning("No Selection", "Select a project to delete.")
         return
     confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{selected}'?")
     if confirm:
         pm.delete_project(selected)
+        _info_cache.clear()
         refresh_project_list()
 
 
@@ -249,6 +556,10 @@ if __name__ == "__main__":
     # --- GUI Setup ---
     root = tk.Tk()
     root.title("Project Manager GUI")
+    _HEADING_FONT = tkfont.Font(root, family="Arial", size=12, weight="bold")
+
+    # Shared by every "Edit Project" click; hidden between uses
+    selection_dialog = ReusableSelectionDialog(root, "Select Update Method")
 
     btn_create = tk.Button(root, text="Create Project", command=create_project)
     btn_create.pack()
@@ -259,8 +570,10 @@ if __name__ == "__main__":
     btn_edit = tk.Button(root, text="Edit Project", command=edit)
     btn_edit.pack()
 
-    listbox = tk.Listbox(root)
+    # Keep the selection when text is selected elsewhere (e.g. in the console)
+    listbox = tk.Listbox(root, exportselection=False)
     listbox.pack(fill=tk.BOTH, expand=True)
+    listbox.bind("<<ListboxSelect>>", _on_listbox_select)
 
     btn_info = tk.Button(root, text="Show Project Info", command=show_project_info)
     btn_info.pack()
@@ -277,6 +590,10 @@ if __name__ == "__main__":
     log_text = tk.Text(log_frame, height=10, bg="black", fg="white")
     log_text.pack(fill=tk.BOTH, expand=True)
 
+    # Log records can come from the index writer thread, which must not touch Tk, and
+    # from the exit-time index flush after the window is gone: send them to the real stderr
+    logging.basicConfig(stream=sys.__stderr__, format="[%(levelname)s] %(name)s: %(message)s")
+
     # Redirect stdout and stderr to the GUI console
     sys.stdout = TextRedirector(log_text)
     sys.stderr = TextRedirector(log_text)
@@ -1,21 +1,55 @@
 from pathlib import Path
-from config import INDEX_FILE, PROJECTS_DIR
 from ProjectManager import ProjectManager
+import shutil
+import tempfile
 
-# Initialize ProjectManager
-pm = ProjectManager(index_file=INDEX_FILE, projects_dir=PROJECTS_DIR)
+# Fixture model files live next to this script
+BASE = Path(__file__).resolve().parent
+
+# Everything runs on a fresh index in a scratch directory, so the script works on any
+# machine and never touches the tracked fixtures
+WORK = Path(tempfile.mkdtemp(prefix="projectmanager_test_"))
+index_file = WORK / "project_index.pkl"
+projects_dir = WORK / "projects"
 
 master_id = "MAAS"
 
-# Paths
-project1_file = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/ProjectManager_test/projects/HAM_1/cube.stl")
-project2_file = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/ProjectManager_test/projects/HAM_2/sphere.stl")
-project2_new_file = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/ProjectManager_test/sphere_new.stl")
-project2_archive = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/ProjectManager_test/projects/HAM_2/archive")
-project2_new_archive = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/ProjectManager_test/projects/HAM_2/archive_new")
-project1_archive = Path("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/ProjectManager_test/projects/HAM_1/archive")
+project1_file = WORK / "HAM_1" / "cube.stl"
+project2_file = WORK / "HAM_2" / "sphere.stl"
+project2_new_file = WORK / "sphere_new.stl"
+project2_archive = WORK / "HAM_2" / "archive"
+project2_new_archive = WORK / "HAM_2" / "archive_new"
+project1_archive = WORK / "HAM_1" / "archive"
+
+for src, dst in [
+    (BASE / "projects" / "HAM_1" / "cube.stl", project1_file),
+    (BASE / "projects" / "HAM_2" / "sphere.stl", project2_file),
+    (BASE / "sphere_new.stl", project2_new_file),
+]:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(src, dst)
+
+# Initialize ProjectManager
+pm = ProjectManager(index_file=index_file, projects_dir=projects_dir)
+
 
-responsible = {"Design": ["Alice"], "Print": ["Bob"]}
+def assert_persisted(manager=pm):
+    """
+    Open a second ProjectManager on the same files and check it sees the same index and projects.
+    """
+    manager.flush()
+    other = ProjectManager(index_file=manager.index_file, projects_dir=manager.projects_dir)
+    try:
+        assert other.projects_index == manager.projects_index
+        for project_id in manager.projects_index:
+            project, reloaded = manager._get_project(project_id), other._get_project(project_id)
+            assert reloaded.get_info() == project.get_info()
+            assert reloaded.change_log == project.change_log
+    finally:
+        other.close()
+
+
+responsibility = {"Design": ["Alice"], "Print": ["Bob"]}
 
 # ---------------------------
 # Test 1: Create Project 1 and 2
@@ -25,7 +59,7 @@ pm.create_project(
     sub_id=1,
     file=str(project1_file),
     archive_directory=str(project1_archive),
-    responsible=responsible,
+    responsibility=responsibility,
     quantity=1
 )
 
@@ -34,31 +68,40 @@ pm.create_project(
     sub_id=2,
     file=str(project2_file),
     archive_directory=str(project2_archive),
-    responsible=responsible,
+    responsibility=responsibility,
     quantity=2
 )
 
 print("\n[After Test 1]: Project List:")
 print(pm.get_project_list())
+assert pm.get_project_list() == ["HAM_1", "HAM_2"]
+assert_persisted()
 
 
 # ---------------------------
 # Test 2: Comments, file updates, shipping info
 # ---------------------------
-# Project 1: Comments and name updates
-pm.update_project("HAM_1", "add_comment", "First comment.")
-pm.update_project("HAM_1", "add_comment", "Second comment.")
-pm.update_project("HAM_1", "edit_comment", {"updated_comment": "Updated second comment.", "comment_id": 2})
-pm.update_project("HAM_1", "update_name", "Cube Project")
-pm.update_project("HAM_1", "remove_comment", 1)
+# Project 1: Comments and name updates, saved once as a batch
+pm.update_project_batch("HAM_1", [
+    ("add_comment", "First comment."),
+    ("add_comment", "Second comment."),
+    ("edit_comment", {"updated_comment": "Updated second comment.", "comment_id": 2}),
+    ("update_name", "Cube Project"),
+    ("remove_comment", 1),
+])
 
 # Project 2: File update (new version) and shipping info
-pm.update_project("HAM_2", "update_file", {"new_file": str(project2_new_file), "new_version": True})
-pm.update_project("HAM_2", "update_shipping_info", {"new_shipping_info": {"Post Code": "12345", "Address": "42 Wallaby Way"}})
+pm.update_project_batch("HAM_2", [
+    ("update_file", {"new_file": str(project2_new_file), "new_version": True}),
+    ("update_shipping_info", {"new_shipping_info": {"Post Code": "12345", "Address": "42 Wallaby Way"}}),
+])
 
 
 print("\n[After Test 2]: Project List:")
 print(pm.get_project_list())
+assert list(pm._get_project("HAM_1").comments) == ["comment_2"]
+assert pm._get_project("HAM_2").shipping_info.post_code == "12345"
+assert_persisted()
 
 
 # ---------------------------
@@ -88,6 +131,9 @@ pm.delete_project("HAM_1")
 
 print("\n[After Test 5]: Project List:")
 print(pm.get_project_list())
+assert "HAM_1" not in pm.projects_index
+assert not (projects_dir / pm._project_filename("HAM_1")).exists()
+assert_persisted()
 
 
 # ---------------------------
@@ -95,3 +141,61 @@ print(pm.get_project_list())
 # ---------------------------
 print("\n[After Test 6]: Final Project List:")
 print(pm.get_project_list())
+
+
+# ---------------------------
+# Test 7: bulk() keeps its queued changes through a failed action and cache eviction
+# ---------------------------
+pm.PROJECT_CACHE_SIZE = 2
+with pm.bulk():
+    pm.update_project("HAM_2", "update_status", "Printing")
+    pm.update_project("HAM_2", "remove_comment", 99)  # fails, must not discard the status change
+    pm.update_project("HAM_2", "update_quantity", 9)
+    for sub_id in range(3, 7):
+        pm.create_project(master_id, sub_id, str(project1_file), str(project1_archive), responsibility)
+    for sub_id in range(3, 7):
+        pm.update_project(f"{master_id}_{sub_id}", "update_status", "Queued")
+    for sub_id in range(3, 7):
+        pm.update_project(f"{master_id}_{sub_id}", "update_quantity", sub_id)
+pm.flush()
+
+reopened = ProjectManager(index_file=index_file, projects_dir=projects_dir)
+project2 = reopened._get_project("HAM_2")
+assert (project2.status, project2.quantity) == ("Printing", 9)
+for sub_id in range(3, 7):
+    project = reopened._get_project(f"{master_id}_{sub_id}")
+    assert (project.status, project.quantity) == ("Queued", sub_id)
+    assert reopened.projects_index[f"{master_id}_{sub_id}"]["status"] == "Queued"
+reopened.close()
+
+print("\n[After Test 7]: Project List:")
+print(pm.get_project_list())
+
+
+# ---------------------------
+# Test 8: Changing a project ID moves its pickle and index row
+# ---------------------------
+pm.update_project("MAAS_3", "update_master_id", "ZED")
+assert "MAAS_3" not in pm.projects_index and "ZED_3" in pm.projects_index
+assert not (projects_dir / pm._project_filename("MAAS_3")).exists()
+assert_persisted()
+
+
+# ---------------------------
+# Test 9: A small journal limit compacts the journal into the snapshot
+# ---------------------------
+ProjectManager.JOURNAL_COMPACT_BYTES, default_compact_bytes = 256, ProjectManager.JOURNAL_COMPACT_BYTES
+compact_pm = ProjectManager(index_file=WORK / "compact_index.pkl", projects_dir=projects_dir)
+ProjectManager.JOURNAL_COMPACT_BYTES = default_compact_bytes
+for sub_id in range(1, 6):
+    compact_pm.create_project("CMP", sub_id, str(project1_file), str(project1_archive), responsibility)
+for sub_id in range(1, 6):
+    compact_pm.update_project(f"CMP_{sub_id}", "update_status", "Compacted")
+compact_pm.flush()
+assert compact_pm.index_file.exists()
+assert compact_pm.journal_file.stat().st_size <= 256
+assert_persisted(compact_pm)
+compact_pm.close()
+
+pm.close()
+shutil.rmtree(WORK)
@@ -1,20 +1,65 @@
-from ProjectManager import Project
+from ProjectManager import Project, ShippingInfo
 from pathlib import Path
-import shutil
-
-# Clean up from previous runs (for idempotency in testing)
-shutil.rmtree("", ignore_errors=True)
-shutil.rmtree("../test_archive", ignore_errors=True)
-
-# Setup folders and initial file
-test_file_dir = Path("")
-test_archive_dir = Path("../test_archive")
-test_file_dir.mkdir(exist_ok=True, parents=True)
-test_archive_dir.mkdir(exist_ok=True, parents=True)
+import os
+import sys
+import tempfile
+
+
+def _rmtree(path):
+    """
+    Remove a directory tree with a single os.scandir pass per directory; missing paths are ignored.
+    """
+    try:
+        _clear_dir(path)
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+
+
+def _clear_dir(path):
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def reset_dir(path):
+    """
+    Leave path as an empty directory: clear it in one scan if it exists, otherwise create it.
+    """
+    try:
+        _clear_dir(path)
+    except FileNotFoundError:
+        os.makedirs(path)
+
+
+def fast_write(path, data):
+    """
+    Write data to path with bare os.open/os.write/os.close, skipping the io/pathlib layers.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        os.write(fd, data.encode())
+    finally:
+        os.close(fd)
+
+
+# All files live in a fresh scratch directory, so the tracked fixtures next to this
+# script are never touched. Paths are absolute strings built once from its root.
+WORK = tempfile.mkdtemp(prefix="project_test_")
+DIR = os.path.join(WORK, "files")
+reset_dir(DIR)
+test_archive_dir = Path(os.path.join(WORK, "archive"))
+reset_dir(test_archive_dir)
+# Targets for update_file_directories
+moved_file_dir = os.path.join(WORK, "test_file")
+moved_archive_dir = os.path.join(WORK, "test_archive")
 
 # Create initial dummy file
-file_v1 = test_file_dir / "cube.stl"
-file_v1.write_text("version 1 content")
+file_v1 = Path(os.path.join(DIR, "cube.stl"))
+fast_write(file_v1, "version 1 content")
 
 # Initialize Project
 project = Project(
@@ -23,76 +68,90 @@ project = Project(
     file=file_v1,
     archive_directory=test_archive_dir,
     status="Created",
-    responsible={"manager": ["Alice"], "factory": ["Factory A"]},
+    responsibility={"manager": ["Alice"], "factory": ["Factory A"]},
     volume=100.0,
     quantity=2
 )
 
-# --- Test all updates sequentially ---
-
-# Update master ID
-project.update_master_id("HAM_NEW")
+# --- Test all updates in one batched call ---
+project.update(
+    master_id="HAM_NEW",
+    status="Printing",
+    responsibility=("QA", ["Bob", "Charlie"]),
+    quantity=5,
+    name="Special Prototype",
+    customer_id="CUST-001",
+    shipping_info=ShippingInfo(address="123 Main St", post_code="99999"),
+)
 assert project.master_id == "HAM_NEW"
-
-# Update status
-project.update_status("Printing")
 assert project.status == "Printing"
-
-# Update responsible
-project.update_responsible("QA", ["Bob", "Charlie"])
-assert project.responsible["QA"] == ["Bob", "Charlie"]
-
-# Update quantity
-project.update_quantity(5)
+assert project.responsibility["QA"] == ["Bob", "Charlie"]
 assert project.quantity == 5
-
-# Update project name
-project.update_name("Special Prototype")
 assert project.project_name == "Special Prototype"
-
-# Update customer ID
-project.update_customer_id("CUST-001")
 assert project.customer_id == "CUST-001"
-
-# Update shipping info
-project.update_shipping_info({"Address": "123 Main St", "Post Code": "99999"})
-assert project.shipping_info["Post Code"] == "99999"
-
-# Comments
+assert project.shipping_info.post_code == "99999"
+
+# A shipping dict with the wrong keys is rejected instead of silently emptied
+try:
+    project.update_shipping_info({"address": "1 Other St"})
+except ValueError:
+    pass
+else:
+    raise AssertionError("update_shipping_info accepted an unknown key")
+assert project.shipping_info == ShippingInfo(address="123 Main St", post_code="99999")
+
+# Comments: a new project has none, and an added comment can be edited and removed again
+assert not project.comments
 project.add_comment("Initial setup complete.")
 project.edit_comment("Corrected initial comment.", 1)
+assert project.comments["comment_1"].startswith("edited ")
+assert project.comments["comment_1"].endswith(": Corrected initial comment.")
 project.remove_comment(1)
 assert len(project.comments) == 0
 
 # --- Repeated update_file to test versioning & archiving ---
 
-# Version 2
-file_v2 = test_file_dir / "cube_v2.stl"
-file_v2.write_text("version 2 content")
-project.update_file("cube_v2.stl", new_version=True)
-
-
-# Version 3
-file_v3 = test_file_dir / "cube_v3.stl"
-file_v3.write_text("version 3 content")
-project.update_file("cube_v3.stl", new_version=True)
-
-
-# Version 4
-file_v4 = test_file_dir / "cube_v4.stl"
-file_v4.write_text("version 4 content")
-project.update_file("cube_v4.stl", new_version=True)
-
-file_v4 = test_file_dir / "cube_v4_1.stl"
-file_v4.write_text("version 4_1 content")
-project.update_file("cube_v4_1.stl", new_version=False)
+# Versions 2-4 (archived) and 4_1 (same version), applied as one batch
+file_v2 = os.path.join(DIR, "cube_v2.stl")
+file_v3 = os.path.join(DIR, "cube_v3.stl")
+file_v4 = os.path.join(DIR, "cube_v4.stl")
+file_v4_1 = os.path.join(DIR, "cube_v4_1.stl")
+fast_write(file_v2, "version 2 content")
+fast_write(file_v3, "version 3 content")
+fast_write(file_v4, "version 4 content")
+fast_write(file_v4_1, "version 4_1 content")
+
+project.update_files([(file_v2, True), (file_v3, True), (file_v4, True), (file_v4_1, False)])
+# Previous versions were moved (renamed) into the archive, not copied
+assert not os.path.exists(file_v2)
+
+# One directory scan covers all the archived versions
+with os.scandir(test_archive_dir) as it:
+    archived_names = {entry.name for entry in it}
+assert {"HAM_NEW_1_v1.stl", "HAM_NEW_1_v2.stl", "HAM_NEW_1_v3.stl"} <= archived_names
+# Each archived version holds the content of the file it was archived from
+for version in (1, 2, 3):
+    with open(os.path.join(test_archive_dir, f"HAM_NEW_1_v{version}.stl")) as f:
+        assert f.read() == f"version {version} content"
 
 # Move file and archive directories
-new_file_dir = Path("../new_files")
-new_archive_dir = Path("../new_archive")
-project.update_file_directories("/Users/zhachu16/Documents/Wedge/wdg_pm/tests/test_file", "/Users/zhachu16/Documents/Wedge/wdg_pm/tests/test_archive")
+project.update_file_directories(moved_file_dir, moved_archive_dir)
+# Plain string comparisons; no Path parsing needed to check where things ended up
+file_dir, file_name = os.path.split(str(project.file))
+assert file_name == "cube_v4_1.stl"
+assert file_dir == moved_file_dir
+assert str(project.archive_directory) == moved_archive_dir
 
 
 # --- Final Review: Change Log + File System Check ---
 project.print_info(comment=True, change_log=True)
 
+# Every entry left in the archive should be a plain archived file
+with os.scandir(project.archive_directory) as it:
+    archived = list(it)
+assert all(entry.is_file(follow_symlinks=False) for entry in archived)
+sys.stdout.write("\nArchived files:\n" + "".join(f"{entry.name}\n" for entry in archived))
+
+# Remove the scratch tree; it is left behind for inspection if an assertion fails
+_rmtree(WORK)
+